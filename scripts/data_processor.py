@@ -7,18 +7,28 @@ from tqdm import tqdm
 import multiprocessing as mp
 from functools import partial
 import time
+from match_archive import get_archive, load_match
 
 def load_json_files():
     """Saari JSON files load karta hai"""
-    json_files = glob('data/raw/*.json')[:100]  # ONLY FIRST 100 FILES
+    json_files = glob('data/raw/*.json')
+    
+    # Archive bana hai toh uske matches archive order mein pehle (sequential streaming)
+    archive = get_archive()
+    if archive is not None:
+        archived = [f'data/raw/{match_id}.json' for match_id in archive.match_ids()]
+        archived_set = set(archived)
+        json_files = archived + [f for f in json_files if f.replace(os.sep, '/') not in archived_set]
+    
+    json_files = json_files[:100]  # ONLY FIRST 100 FILES
     print(f"Processing {len(json_files)} JSON files")
     return json_files
 
 def parse_single_file(json_file):
     """Single JSON file process karta hai"""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Archive se padho agar match wahan hai, warna raw JSON file se
+        data = load_match(json_file)
         
         # Basic match info
         match_info = data['info']
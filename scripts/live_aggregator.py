@@ -0,0 +1,168 @@
+import os
+import json
+import heapq
+from collections import defaultdict
+
+# Aggregator state yahan save hota hai (restart ke liye)
+STATE_PATH = 'data/live/aggregator_state.json'
+
+class TopK:
+    """Top-k leaderboard - har update O(log k), scores sirf badhte hain (runs/wickets)"""
+
+    def __init__(self, k=10):
+        self.k = k
+        self.members = {}  # name -> score (sirf top-k players)
+        self._heap = []    # (score, name) min-heap, purani entries lazily skip hoti hain
+
+    def _push(self, name, score):
+        self.members[name] = score
+        heapq.heappush(self._heap, (score, name))
+        # Stale entries zyada ho jaye toh heap dobara banao
+        if len(self._heap) > 4 * self.k:
+            self._heap = [(s, n) for n, s in self.members.items()]
+            heapq.heapify(self._heap)
+
+    def _min(self):
+        while self._heap and self.members.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0]
+
+    def update(self, name, score):
+        """Player ka naya total score - top-k mein aaye toh add karo"""
+        if name in self.members or len(self.members) < self.k:
+            self._push(name, score)
+            return
+
+        min_score, min_name = self._min()
+        if score > min_score:
+            heapq.heappop(self._heap)
+            del self.members[min_name]
+            self._push(name, score)
+
+    def top(self):
+        """Leaderboard highest score se lowest tak"""
+        return sorted(self.members.items(), key=lambda item: (-item[1], item[0]))
+
+class LiveAggregator:
+    """Ball-by-ball delivery events se running aggregates aur leaderboards update karta hai"""
+
+    def __init__(self, k=10):
+        self.k = k
+        self.batsman_runs = defaultdict(int)
+        self.bowler_wickets = defaultdict(int)
+        self.format_runs = defaultdict(int)
+        self.format_balls = defaultdict(int)
+        self.format_overs = defaultdict(set)
+        self.match_balls = defaultdict(int)  # match_id -> kitni deliveries process hui (restart pe resume ke liye)
+        self.top_batsmen = TopK(k)
+        self.top_bowlers = TopK(k)
+
+    def add_delivery(self, event):
+        """Ek delivery event (parse_single_file ki innings row) process karta hai"""
+        self.match_balls[str(event['match_id'])] += 1
+
+        batsman = event['batsman']
+        bowler = event['bowler']
+        match_type = event['match_type']
+
+        self.batsman_runs[batsman] += int(event['runs_batted'])
+        self.top_batsmen.update(batsman, self.batsman_runs[batsman])
+
+        if int(event['wicket']):
+            self.bowler_wickets[bowler] += int(event['wicket'])
+            self.top_bowlers.update(bowler, self.bowler_wickets[bowler])
+
+        self.format_runs[match_type] += int(event['total_runs'])
+        self.format_balls[match_type] += 1
+        self.format_overs[match_type].add(int(event['over']))
+
+    def add_innings(self, innings_df):
+        """Match ki innings DataFrame (parse_single_file output) feed karta hai - pehle se process hui deliveries skip"""
+        added = 0
+        for match_id, match_innings in innings_df.groupby('match_id', sort=False):
+            # Restart ke baad replay: jitni deliveries state mein hain utni skip karo
+            for event in match_innings.iloc[self.match_balls[str(match_id)]:].to_dict('records'):
+                self.add_delivery(event)
+                added += 1
+        return added
+
+    def run_rate_by_format(self):
+        """Chart 10 wala runs per over - total runs / unique overs"""
+        return {
+            fmt: self.format_runs[fmt] / len(overs) if len(overs) > 0 else 0
+            for fmt, overs in self.format_overs.items()
+        }
+
+    def leaderboards(self):
+        return {
+            'top_batsmen': self.top_batsmen.top(),
+            'top_bowlers': self.top_bowlers.top(),
+            'run_rate_by_format': self.run_rate_by_format()
+        }
+
+    def save_state(self, path=STATE_PATH):
+        """State disk pe save karta hai - temp file se atomic replace"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        state = {
+            'k': self.k,
+            'batsman_runs': self.batsman_runs,
+            'bowler_wickets': self.bowler_wickets,
+            'format_runs': self.format_runs,
+            'format_balls': self.format_balls,
+            'format_overs': {fmt: sorted(overs) for fmt, overs in self.format_overs.items()},
+            'match_balls': self.match_balls
+        }
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_state(cls, path=STATE_PATH, k=10):
+        """Saved state se aggregator banata hai, file nahi hai toh khaali aggregator"""
+        if not os.path.exists(path):
+            return cls(k)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+        agg = cls(state.get('k', k))
+        agg.batsman_runs.update(state['batsman_runs'])
+        agg.bowler_wickets.update(state['bowler_wickets'])
+        agg.format_runs.update(state['format_runs'])
+        agg.format_balls.update(state['format_balls'])
+        for fmt, overs in state['format_overs'].items():
+            agg.format_overs[fmt] = set(overs)
+        agg.match_balls.update(state['match_balls'])
+
+        # Leaderboards totals se dobara banao
+        for batsman, runs in agg.batsman_runs.items():
+            agg.top_batsmen.update(batsman, runs)
+        for bowler, wickets in agg.bowler_wickets.items():
+            agg.top_bowlers.update(bowler, wickets)
+        return agg
+
+if __name__ == "__main__":
+    from data_processor import load_json_files, parse_single_file
+
+    # Saved state se shuru karo aur saare matches ball-by-ball feed karo
+    agg = LiveAggregator.load_state()
+    added = 0
+    for json_file in load_json_files():
+        innings_df, match_df = parse_single_file(json_file)
+        if not innings_df.empty:
+            added += agg.add_innings(innings_df)
+    agg.save_state()
+
+    print(f"\n📊 Live Aggregation Summary ({added:,} new deliveries):")
+    boards = agg.leaderboards()
+    print("\nTop Batsmen:")
+    for name, runs in boards['top_batsmen']:
+        print(f" - {name}: {runs}")
+    print("\nTop Bowlers:")
+    for name, wickets in boards['top_bowlers']:
+        print(f" - {name}: {wickets}")
+    print("\nRuns per Over by Format:")
+    for fmt, run_rate in boards['run_rate_by_format'].items():
+        print(f" - {fmt}: {run_rate:.2f}")
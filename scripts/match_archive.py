@@ -0,0 +1,137 @@
+import os
+import json
+import zlib
+from glob import glob
+
+# Archive files - raw JSON matches yahan pack hote hain
+ARCHIVE_PATH = 'data/archive/matches.bin'
+INDEX_PATH = 'data/archive/matches_index.json'
+
+# Ek chunk mein kitna uncompressed data jaata hai (bytes)
+CHUNK_SIZE = 1024 * 1024
+
+def _match_id_from_path(json_file):
+    """File path se match_id nikalta hai"""
+    return os.path.basename(json_file).replace('.json', '')
+
+def build_archive(json_files, archive_path=ARCHIVE_PATH, index_path=INDEX_PATH, chunk_size=CHUNK_SIZE):
+    """Raw JSON files ko compressed chunks mein pack karta hai aur match_id -> offset index likhta hai"""
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+
+    index = {}
+    chunk = bytearray()
+    chunk_members = []
+    offset = 0
+
+    with open(archive_path, 'wb') as archive:
+        def flush_chunk():
+            # Chunk compress karo aur uske saare matches ka offset index mein daalo
+            nonlocal offset, chunk, chunk_members
+            if not chunk:
+                return
+            compressed = zlib.compress(bytes(chunk), 9)
+            archive.write(compressed)
+            for match_id, start, length in chunk_members:
+                index[match_id] = [offset, len(compressed), start, length]
+            offset += len(compressed)
+            chunk = bytearray()
+            chunk_members = []
+
+        for json_file in sorted(json_files):
+            with open(json_file, 'rb') as f:
+                raw = f.read()
+
+            chunk_members.append((_match_id_from_path(json_file), len(chunk), len(raw)))
+            chunk.extend(raw)
+
+            if len(chunk) >= chunk_size:
+                flush_chunk()
+
+        flush_chunk()
+
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump({'chunk_size': chunk_size, 'matches': index}, f)
+
+    print(f"✓ Packed {len(index)} matches into {archive_path} ({offset / 1024:.1f} KB)")
+    return index
+
+class MatchArchive:
+    """Compressed archive se single match O(1) mein padhta hai (index lookup + ek chunk decompress)"""
+
+    def __init__(self, archive_path=ARCHIVE_PATH, index_path=INDEX_PATH):
+        self.archive_path = archive_path
+        with open(index_path, 'r', encoding='utf-8') as f:
+            self.index = json.load(f)['matches']
+        self._file = None
+        # Last decompressed chunk cache - sequential reads mein har chunk ek hi baar decompress hota hai
+        self._chunk_offset = None
+        self._chunk_data = None
+
+    def __contains__(self, match_id):
+        return match_id in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def match_ids(self):
+        """Match IDs archive order mein (sequential streaming ke liye)"""
+        return sorted(self.index, key=lambda match_id: (self.index[match_id][0], self.index[match_id][2]))
+
+    def _read_chunk(self, offset, length):
+        if self._chunk_offset != offset:
+            if self._file is None:
+                self._file = open(self.archive_path, 'rb')
+            self._file.seek(offset)
+            self._chunk_data = zlib.decompress(self._file.read(length))
+            self._chunk_offset = offset
+        return self._chunk_data
+
+    def read_bytes(self, match_id):
+        """Single match ke raw JSON bytes return karta hai"""
+        offset, length, start, size = self.index[match_id]
+        return self._read_chunk(offset, length)[start:start + size]
+
+    def read_match(self, match_id):
+        """Single match ka parsed JSON return karta hai"""
+        return json.loads(self.read_bytes(match_id).decode('utf-8'))
+
+    def iter_matches(self):
+        """Saare matches archive order mein stream karta hai"""
+        for match_id in self.match_ids():
+            yield match_id, self.read_match(match_id)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._chunk_offset = None
+        self._chunk_data = None
+
+_archive = None
+
+def get_archive():
+    """Shared archive reader return karta hai, agar archive nahi bana toh None"""
+    global _archive
+    if _archive is None and os.path.exists(ARCHIVE_PATH) and os.path.exists(INDEX_PATH):
+        _archive = MatchArchive()
+    return _archive
+
+def load_match(json_file):
+    """Match JSON load karta hai - pehle archive se, warna raw file se"""
+    archive = get_archive()
+    match_id = _match_id_from_path(json_file)
+
+    if archive is not None and match_id in archive:
+        return archive.read_match(match_id)
+
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+if __name__ == "__main__":
+    # data/raw ki saari JSON files pack karo
+    json_files = glob('data/raw/*.json')
+
+    if len(json_files) == 0:
+        print("Koi JSON files nahi mili! Pehle scraper.py run karo.")
+    else:
+        build_archive(json_files)
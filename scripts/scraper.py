@@ -2,6 +2,8 @@ import os
 import requests
 import zipfile
 from tqdm import tqdm
+from glob import glob
+from match_archive import build_archive
 
 # Setup output directory
 output_dir = "data/raw"
@@ -71,4 +73,7 @@ def cleanup_extra_files():
 if __name__ == "__main__":
     download_selected_files()
     cleanup_extra_files()
+    
+    # Raw matches ko compressed archive mein pack karo
+    build_archive(glob(os.path.join(output_dir, '*.json')))
     print("Download complete! Files data/raw/ mein save hui.")
\ No newline at end of file